@@ -4,19 +4,105 @@
 """
 
 import json
+import marshal
+import mmap
 import os
-from typing import List, Dict, Optional
+import sys
+from bisect import bisect_right
+from typing import List, Dict, Iterable, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+
+# Файлы больше этого размера читаются потоково через ijson (если он установлен)
+_STREAM_THRESHOLD = 16 * 1024 * 1024
+
+# Поисковые буферы больше этого размера обрабатываются ядром на Numba
+_JIT_THRESHOLD = 1024 * 1024
+
+# Формат строки контакта при выводе: ID, имя, телефон, комментарий
+_CONTACT_FORMAT = "ID: {} | {} | {} | {}"
+
+# Поля, по которым ищет каждый пункт меню поиска
+_SEARCH_FIELDS = {
+    "1": ('name',),
+    "2": ('phone',),
+    "3": ('comment',),
+    "4": ('name', 'phone', 'comment'),
+}
+
+# Количество контактов на одной странице при выводе списка
+_PAGE_SIZE = 50
+
+# Версия формата двоичного кэша; кэш другой версии игнорируется
+_CACHE_FORMAT = (1, marshal.version)
+
+# Исключения, означающие поврежденный JSON
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
+
+# Таблица для str.translate, удаляющая допустимые в телефоне символы
+_PHONE_ALLOWED_DELETE = str.maketrans('', '', '0123456789+-() ')
+
+# Таблица для str.translate, удаляющая символы оформления телефона
+_PHONE_FORMATTING_DELETE = str.maketrans('', '', '-() ')
+
+
+def _write_atomic(filename: str, payload: bytes):
+    """Записывает файл через временный, чтобы сбой во время записи не испортил его"""
+    tmp_filename = filename + '.tmp'
+    try:
+        with open(tmp_filename, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+
+
+def _json_loads(raw):
+    """Разбирает JSON из байтового буфера (через orjson, если он доступен)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+def _json_dumps(data) -> bytes:
+    """Сериализует данные в JSON с отступами (через orjson, если он доступен)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
 
 class Contact:
     """Класс для представления контакта"""
     
+    __slots__ = ('id', 'name', 'phone', 'comment')
+    
     def __init__(self, name: str, phone: str, comment: str = "", contact_id: Optional[int] = None):
         self.id = contact_id
-        self.name = name.strip()
-        self.phone = phone.strip()
-        self.comment = comment.strip()
+        # Интернируем строки: одинаковые значения (частые имена, пустые
+        # комментарии) хранятся в памяти в одном экземпляре
+        self.name = sys.intern(name.strip())
+        self.phone = sys.intern(phone.strip())
+        self.comment = sys.intern(comment.strip())
     
     def to_dict(self) -> Dict:
         """Преобразует контакт в словарь"""
@@ -42,20 +128,126 @@ class Contact:
     
     def __str__(self) -> str:
         id_str = str(self.id) if self.id is not None else "Нет"
-        return f"ID: {id_str} | {self.name} | {self.phone} | {self.comment}"
+        return _CONTACT_FORMAT.format(id_str, self.name, self.phone, self.comment)
     
     def __repr__(self) -> str:
         return self.__str__()
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _find_rows(data, needle, offsets):
+        """Поиск Бойера-Мура-Хорспула по буферу; возвращает номера строк с вхождениями"""
+        n = data.shape[0]
+        m = needle.shape[0]
+        rows = np.empty(offsets.shape[0], dtype=np.int64)
+        count = 0
+        if m == 0 or m > n:
+            return rows[:0]
+        
+        last = m - 1
+        shift = np.full(256, m, dtype=np.int64)
+        for i in range(last):
+            shift[needle[i]] = last - i
+        
+        row = 0
+        pos = 0
+        while pos <= n - m:
+            j = last
+            while j >= 0 and data[pos + j] == needle[j]:
+                j -= 1
+            if j >= 0:
+                pos += shift[data[pos + last]]
+                continue
+            # Строки идут по возрастанию смещений, поэтому номер строки
+            # достаточно сдвигать вперед
+            while row + 1 < offsets.shape[0] and offsets[row + 1] <= pos:
+                row += 1
+            rows[count] = row
+            count += 1
+            # Остальные вхождения в этом же значении не нужны
+            if row + 1 >= offsets.shape[0]:
+                break
+            pos = offsets[row + 1]
+        return rows[:count]
+else:
+    _find_rows = None
+
+
+class SearchBlob:
+    """Упакованный буфер значений одного поля для поиска по подстроке"""
+    
+    # Разделитель значений; не встречается в тексте, вводимом с клавиатуры
+    SEPARATOR = b'\x1f'
+    
+    def __init__(self, values: List[str]):
+        parts = [value.encode('utf-8') for value in values]
+        # offsets[i] - смещение начала i-го значения в буфере
+        self.offsets: List[int] = []
+        pos = 0
+        for part in parts:
+            self.offsets.append(pos)
+            pos += len(part) + 1
+        self.data = self.SEPARATOR.join(parts)
+        self._jit_args = None
+        if _find_rows is not None and len(self.data) > _JIT_THRESHOLD:
+            self._jit_args = (np.frombuffer(self.data, dtype=np.uint8),
+                              np.array(self.offsets, dtype=np.int64))
+    
+    def search(self, term: str) -> List[int]:
+        """Возвращает номера строк, значения которых содержат подстроку"""
+        needle = term.encode('utf-8')
+        if self.SEPARATOR in needle:
+            return []
+        if self._jit_args is not None:
+            data, offsets = self._jit_args
+            return _find_rows(data, np.frombuffer(needle, dtype=np.uint8), offsets).tolist()
+        rows = []
+        pos = self.data.find(needle)
+        while pos != -1:
+            row = bisect_right(self.offsets, pos) - 1
+            rows.append(row)
+            # Остальные вхождения в этом же значении не нужны
+            if row + 1 >= len(self.offsets):
+                break
+            pos = self.data.find(needle, self.offsets[row + 1])
+        return rows
+
+
 class PhoneBook:
     """Класс для работы с телефонным справочником"""
     
     def __init__(self, filename: str = "phonebook.json"):
         self.filename = filename
-        self.contacts: List[Contact] = []
         self.next_id = 1
         self.modified = False
+        # Контакты хранятся по столбцам: i-я строка каждого списка - один контакт
+        self._ids: List[int] = []
+        self._names: List[str] = []
+        self._phones: List[str] = []
+        self._comments: List[str] = []
+        # Поля в нижнем регистре для поиска без учета регистра
+        self._names_lc: List[str] = []
+        self._phones_lc: List[str] = []
+        self._comments_lc: List[str] = []
+        # ID контакта -> номер строки
+        self._pos: Dict[int, int] = {}
+        # Телефон без символов оформления -> ID контактов с этим телефоном
+        self._phone_index: Dict[str, List[int]] = {}
+        # Поисковые буферы по полям; None - требуется перестроение
+        self._blobs: Optional[Dict[str, SearchBlob]] = None
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __getitem__(self, row: int) -> Contact:
+        """Возвращает контакт, находящийся в указанной строке"""
+        return Contact(
+            name=self._names[row],
+            phone=self._phones[row],
+            comment=self._comments[row],
+            contact_id=self._ids[row]
+        )
     
     def load_from_file(self) -> bool:
         """Загружает контакты из файла"""
@@ -64,62 +256,128 @@ class PhoneBook:
                 print(f"Файл {self.filename} не найден. Создан новый справочник.")
                 return True
             
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if self._load_cache():
+                self.modified = False
+                print(f"Загружено контактов: {len(self)}")
+                return True
             
-            # Загружаем контакты с обработкой ошибок валидации
-            contacts_list = []
-            for i, contact_data in enumerate(data.get('contacts', [])):
-                try:
-                    contacts_list.append(Contact.from_dict(contact_data))
-                except (ValueError, KeyError) as e:
-                    print(f"Предупреждение: Пропущен некорректный контакт #{i+1}: {e}")
-                    continue
-            
-            self.contacts = contacts_list
-            
-            # Определяем следующий ID и присваиваем ID контактам без него
-            modified_by_id_assignment = False
-            if self.contacts:
-                # Находим максимальный ID среди контактов, у которых есть ID
-                ids_with_values = [contact.id for contact in self.contacts if contact.id is not None]
-                if ids_with_values:
-                    self.next_id = max(ids_with_values) + 1
+            with open(self.filename, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if not size:
+                    # Пустой файл нельзя отобразить в память
+                    data = _json_loads(b'')
+                    contacts = list(self._parse_contacts(data.get('contacts', [])))
                 else:
-                    self.next_id = 1
-                
-                # Присваиваем ID всем контактам, у которых его нет
-                for contact in self.contacts:
-                    if contact.id is None:
-                        contact.id = self.next_id
-                        self.next_id += 1
-                        modified_by_id_assignment = True
-            else:
-                self.next_id = 1
+                    # Разбираем файл прямо из отображения в память, без копии в bytes
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if ijson is not None and size > _STREAM_THRESHOLD:
+                            # Большой файл разбираем потоково, не держа в памяти весь документ
+                            contacts = list(self._parse_contacts(ijson.items(mm, 'contacts.item')))
+                        else:
+                            with memoryview(mm) as view:
+                                data = _json_loads(view)
+                            contacts = list(self._parse_contacts(data.get('contacts', [])))
+            
+            self._clear()
+            without_id: List[int] = []
+            max_id = 0
+            for row, contact in enumerate(contacts):
+                self._append_row(contact.id, contact.name, contact.phone, contact.comment)
+                if contact.id is None or contact.id in self._pos:
+                    # Повторяющийся ID обрабатываем так же, как отсутствующий
+                    without_id.append(row)
+                else:
+                    self._pos[contact.id] = row
+                    if contact.id > max_id:
+                        max_id = contact.id
+            self.next_id = max_id + 1
+            
+            # Присваиваем ID всем контактам, у которых его нет
+            for row in without_id:
+                self._ids[row] = self.next_id
+                self._pos[self.next_id] = row
+                self.next_id += 1
+            modified_by_id_assignment = bool(without_id)
+            self._rebuild_phone_index()
             
             # Не сбрасываем modified, если мы только что добавили ID контактам
             if not modified_by_id_assignment:
                 self.modified = False
-            print(f"Загружено контактов: {len(self.contacts)}")
+                # Столбцы в точности соответствуют файлу - их можно закэшировать
+                self._save_cache()
+            print(f"Загружено контактов: {len(self)}")
             return True
             
-        except json.JSONDecodeError:
+        except _JSON_ERRORS:
             print(f"Ошибка: Файл {self.filename} поврежден или имеет неверный формат.")
             return False
         except Exception as e:
             print(f"Ошибка при загрузке файла: {e}")
             return False
     
+    @staticmethod
+    def _parse_contacts(items):
+        """Создает контакты из записей файла, пропуская некорректные"""
+        for i, contact_data in enumerate(items):
+            try:
+                yield Contact.from_dict(contact_data)
+            except (ValueError, KeyError) as e:
+                print(f"Предупреждение: Пропущен некорректный контакт #{i+1}: {e}")
+    
+    def _cache_filename(self) -> str:
+        """Возвращает имя файла двоичного кэша справочника"""
+        return self.filename + '.cache'
+    
+    def _load_cache(self) -> bool:
+        """Восстанавливает контакты из двоичного кэша, если он соответствует файлу"""
+        try:
+            stat = os.stat(self.filename)
+            with open(self._cache_filename(), 'rb') as f:
+                cached = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+        
+        # Кэш действителен, только если файл не менялся после его записи
+        header = (_CACHE_FORMAT, stat.st_mtime_ns, stat.st_size)
+        if not isinstance(cached, tuple) or len(cached) != 10 or cached[:3] != header:
+            return False
+        
+        self._clear()
+        (self._ids, self._names, self._phones, self._comments,
+         self._names_lc, self._phones_lc, self._comments_lc) = cached[3:]
+        self._pos = dict(zip(self._ids, range(len(self._ids))))
+        self.next_id = max(self._ids, default=0) + 1
+        self._rebuild_phone_index()
+        return True
+    
+    def _save_cache(self):
+        """Записывает столбцы в двоичный кэш рядом с файлом справочника"""
+        try:
+            stat = os.stat(self.filename)
+            payload = marshal.dumps((
+                _CACHE_FORMAT, stat.st_mtime_ns, stat.st_size,
+                self._ids, self._names, self._phones, self._comments,
+                self._names_lc, self._phones_lc, self._comments_lc,
+            ))
+            _write_atomic(self._cache_filename(), payload)
+        except OSError:
+            # Кэш необязателен: без него справочник просто загрузится из JSON
+            pass
+    
     def save_to_file(self) -> bool:
         """Сохраняет контакты в файл"""
         try:
             data = {
-                'contacts': [contact.to_dict() for contact in self.contacts],
+                'contacts': [
+                    {'id': contact_id, 'name': name, 'phone': phone, 'comment': comment}
+                    for contact_id, name, phone, comment
+                    in zip(self._ids, self._names, self._phones, self._comments)
+                ],
                 'last_updated': datetime.now().isoformat()
             }
             
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _write_atomic(self.filename, _json_dumps(data))
+            self._save_cache()
             
             self.modified = False
             print(f"Справочник сохранен в файл {self.filename}")
@@ -130,16 +388,30 @@ class PhoneBook:
             return False
     
     def show_all_contacts(self):
-        """Показывает все контакты"""
-        if not self.contacts:
+        """Показывает все контакты постранично"""
+        if not self._ids:
             print("Справочник пуст.")
             return
         
+        total = len(self._ids)
         print("\n" + "="*60)
         print("ВСЕ КОНТАКТЫ")
         print("="*60)
-        for contact in self.contacts:
-            print(contact)
+        try:
+            for start in range(0, total, _PAGE_SIZE):
+                if start:
+                    answer = input(f"-- Показано {start} из {total}. "
+                                   f"Enter - следующая страница, q - закончить: ").strip().lower()
+                    if answer in ['q', 'й']:
+                        break
+                # Форматируем строки страницы прямо из столбцов и выводим одной записью
+                stop = min(start + _PAGE_SIZE, total)
+                page = map(_CONTACT_FORMAT.format, self._ids[start:stop], self._names[start:stop],
+                           self._phones[start:stop], self._comments[start:stop])
+                sys.stdout.write('\n'.join(page) + '\n')
+        except KeyboardInterrupt:
+            print("\n\nОперация отменена.")
+            return
         print("="*60 + "\n")
     
     def create_contact(self):
@@ -162,29 +434,39 @@ class PhoneBook:
             if not self._validate_phone(phone):
                 print("Предупреждение: Телефон может содержать только цифры, пробелы, +, -, (, )")
             
-            comment = input("Введите комментарий (необязательно): ").strip()
+            duplicates = self._find_by_phone(phone)
+            if duplicates:
+                ids_str = ", ".join(str(contact_id) for contact_id in duplicates)
+                print(f"Предупреждение: Этот телефон уже есть у контактов с ID {ids_str}")
             
-            contact = Contact(
-                name=name,
-                phone=phone,
-                comment=comment,
-                contact_id=self.next_id
-            )
+            comment = input("Введите комментарий (необязательно): ").strip()
             
-            self.contacts.append(contact)
-            self.next_id += 1
+            contact_id = self._add_contact(name, phone, comment)
             self.modified = True
             
-            print(f"\nКонтакт '{name}' успешно создан с ID {contact.id}")
+            print(f"\nКонтакт '{name}' успешно создан с ID {contact_id}")
             
         except KeyboardInterrupt:
             print("\n\nОперация отменена.")
         except Exception as e:
             print(f"Ошибка при создании контакта: {e}")
     
+    def create_contact_bulk(self, rows: Iterable[Tuple[str, str, str]]) -> int:
+        """Добавляет контакты (имя, телефон, комментарий), пропуская дубликаты по телефону"""
+        added = 0
+        for name, phone, comment in rows:
+            name, phone, comment = name.strip(), phone.strip(), comment.strip()
+            if not name or not phone or self._find_by_phone(phone):
+                continue
+            self._add_contact(name, phone, comment)
+            added += 1
+        if added:
+            self.modified = True
+        return added
+    
     def find_contact(self):
         """Поиск контакта"""
-        if not self.contacts:
+        if not self._ids:
             print("Справочник пуст.")
             return
         
@@ -203,26 +485,22 @@ class PhoneBook:
                 print("Поисковый запрос не может быть пустым.")
                 return
             
-            results = []
+            fields = _SEARCH_FIELDS.get(choice)
+            if fields is None:
+                print("Неверный выбор. Используется общий поиск.")
+                fields = _SEARCH_FIELDS["4"]
             
-            if choice == "1":
-                results = [c for c in self.contacts if search_term in c.name.lower()]
-            elif choice == "2":
-                # Поиск по телефону без учета регистра (для консистентности)
-                results = [c for c in self.contacts if search_term in c.phone.lower()]
-            elif choice == "3":
-                results = [c for c in self.contacts if search_term in c.comment.lower()]
-            elif choice == "4":
-                results = [c for c in self.contacts 
-                          if search_term in c.name.lower() 
-                          or search_term in c.phone.lower()
-                          or search_term in c.comment.lower()]
+            # Поиск по всем полям, включая телефон, ведется без учета регистра
+            blobs = self._search_blobs()
+            if len(fields) == 1:
+                rows = blobs[fields[0]].search(search_term)
             else:
-                print("Неверный выбор. Используется общий поиск.")
-                results = [c for c in self.contacts 
-                          if search_term in c.name.lower() 
-                          or search_term in c.phone.lower()
-                          or search_term in c.comment.lower()]
+                found = set()
+                for field in fields:
+                    found.update(blobs[field].search(search_term))
+                rows = sorted(found)
+            
+            results = [self[row] for row in rows]
             
             if results:
                 print(f"\nНайдено контактов: {len(results)}")
@@ -240,7 +518,7 @@ class PhoneBook:
     
     def edit_contact(self):
         """Редактирование контакта"""
-        if not self.contacts:
+        if not self._ids:
             print("Справочник пуст.")
             return
         
@@ -252,29 +530,38 @@ class PhoneBook:
                 return
             
             contact_id = int(contact_id)
-            contact = self._find_by_id(contact_id)
+            row = self._pos.get(contact_id)
             
-            if not contact:
+            if row is None:
                 print(f"Контакт с ID {contact_id} не найден.")
                 return
             
             print(f"\nТекущие данные контакта:")
-            print(contact)
+            print(self[row])
             print("\nВведите новые данные (оставьте пустым, чтобы оставить без изменений):")
             
-            new_name = input(f"Имя [{contact.name}]: ").strip()
-            if new_name:
-                contact.name = new_name
+            new_name = input(f"Имя [{self._names[row]}]: ").strip()
             
-            new_phone = input(f"Телефон [{contact.phone}]: ").strip()
-            if new_phone:
-                if not self._validate_phone(new_phone):
-                    print("Предупреждение: Телефон может содержать только цифры, пробелы, +, -, (, )")
-                contact.phone = new_phone
+            new_phone = input(f"Телефон [{self._phones[row]}]: ").strip()
+            if new_phone and not self._validate_phone(new_phone):
+                print("Предупреждение: Телефон может содержать только цифры, пробелы, +, -, (, )")
+            
+            new_comment = input(f"Комментарий [{self._comments[row]}]: ").strip()
             
-            new_comment = input(f"Комментарий [{contact.comment}]: ").strip()
+            # Поля меняем только после ввода всех данных, чтобы при отмене
+            # операции контакт остался без изменений
+            if new_name:
+                self._names[row] = sys.intern(new_name)
+                self._names_lc[row] = sys.intern(new_name.lower())
+            if new_phone:
+                self._unindex_phone(contact_id, self._phones[row])
+                self._index_phone(contact_id, new_phone)
+                self._phones[row] = sys.intern(new_phone)
+                self._phones_lc[row] = sys.intern(new_phone.lower())
             if new_comment:
-                contact.comment = new_comment
+                self._comments[row] = sys.intern(new_comment)
+                self._comments_lc[row] = sys.intern(new_comment.lower())
+            self._blobs = None
             
             self.modified = True
             print(f"\nКонтакт с ID {contact_id} успешно изменен.")
@@ -286,7 +573,7 @@ class PhoneBook:
     
     def delete_contact(self):
         """Удаление контакта"""
-        if not self.contacts:
+        if not self._ids:
             print("Справочник пуст.")
             return
         
@@ -298,19 +585,19 @@ class PhoneBook:
                 return
             
             contact_id = int(contact_id)
-            contact = self._find_by_id(contact_id)
+            row = self._pos.get(contact_id)
             
-            if not contact:
+            if row is None:
                 print(f"Контакт с ID {contact_id} не найден.")
                 return
             
             print(f"\nКонтакт для удаления:")
-            print(contact)
+            print(self[row])
             
             confirm = input("\nВы уверены? (да/нет): ").strip().lower()
             
             if confirm in ['да', 'yes', 'y', 'д']:
-                self.contacts.remove(contact)
+                self._remove_row(row)
                 self.modified = True
                 print(f"Контакт с ID {contact_id} успешно удален.")
             else:
@@ -321,18 +608,94 @@ class PhoneBook:
         except Exception as e:
             print(f"Ошибка при удалении контакта: {e}")
     
+    def _clear(self):
+        """Удаляет все контакты из памяти"""
+        self._ids = []
+        self._names = []
+        self._phones = []
+        self._comments = []
+        self._names_lc = []
+        self._phones_lc = []
+        self._comments_lc = []
+        self._pos = {}
+        self._phone_index = {}
+        self._blobs = None
+    
+    def _add_contact(self, name: str, phone: str, comment: str) -> int:
+        """Добавляет контакт со следующим свободным ID и возвращает этот ID"""
+        contact_id = self.next_id
+        self._pos[contact_id] = len(self._ids)
+        self._append_row(contact_id, name, phone, comment)
+        self._index_phone(contact_id, phone)
+        self.next_id += 1
+        return contact_id
+    
+    def _append_row(self, contact_id: Optional[int], name: str, phone: str, comment: str):
+        """Добавляет строку с контактом в конец столбцов"""
+        self._blobs = None
+        self._ids.append(contact_id)
+        self._names.append(sys.intern(name))
+        self._phones.append(sys.intern(phone))
+        self._comments.append(sys.intern(comment))
+        self._names_lc.append(sys.intern(name.lower()))
+        self._phones_lc.append(sys.intern(phone.lower()))
+        self._comments_lc.append(sys.intern(comment.lower()))
+    
+    def _remove_row(self, row: int):
+        """Удаляет строку за O(1), перенося на ее место последний контакт"""
+        self._blobs = None
+        del self._pos[self._ids[row]]
+        self._unindex_phone(self._ids[row], self._phones[row])
+        last = len(self._ids) - 1
+        for column in (self._ids, self._names, self._phones, self._comments,
+                       self._names_lc, self._phones_lc, self._comments_lc):
+            column[row] = column[last]
+            column.pop()
+        if row < last:
+            self._pos[self._ids[row]] = row
+    
+    def _rebuild_phone_index(self):
+        """Перестраивает индекс телефонов по всем контактам"""
+        self._phone_index = {}
+        for contact_id, phone in zip(self._ids, self._phones):
+            self._index_phone(contact_id, phone)
+    
+    def _index_phone(self, contact_id: int, phone: str):
+        """Добавляет телефон контакта в индекс"""
+        key = phone.translate(_PHONE_FORMATTING_DELETE)
+        self._phone_index.setdefault(key, []).append(contact_id)
+    
+    def _unindex_phone(self, contact_id: int, phone: str):
+        """Удаляет телефон контакта из индекса"""
+        key = phone.translate(_PHONE_FORMATTING_DELETE)
+        ids = self._phone_index[key]
+        ids.remove(contact_id)
+        if not ids:
+            del self._phone_index[key]
+    
+    def _find_by_phone(self, phone: str) -> List[int]:
+        """Возвращает ID контактов с таким же телефоном (без учета оформления)"""
+        return list(self._phone_index.get(phone.translate(_PHONE_FORMATTING_DELETE), ()))
+    
+    def _search_blobs(self) -> Dict[str, SearchBlob]:
+        """Возвращает поисковые буферы, перестраивая их после изменений"""
+        if self._blobs is None:
+            self._blobs = {
+                'name': SearchBlob(self._names_lc),
+                'phone': SearchBlob(self._phones_lc),
+                'comment': SearchBlob(self._comments_lc),
+            }
+        return self._blobs
+    
     def _find_by_id(self, contact_id: int) -> Optional[Contact]:
         """Находит контакт по ID"""
-        for contact in self.contacts:
-            if contact.id == contact_id:
-                return contact
-        return None
+        row = self._pos.get(contact_id)
+        return None if row is None else self[row]
     
     @staticmethod
     def _validate_phone(phone: str) -> bool:
         """Проверяет формат телефона"""
-        allowed_chars = set('0123456789+-() ')
-        return all(c in allowed_chars for c in phone)
+        return not phone.translate(_PHONE_ALLOWED_DELETE)
     
     def has_unsaved_changes(self) -> bool:
         """Проверяет наличие несохраненных изменений"""